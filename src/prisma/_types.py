@@ -67,6 +67,8 @@ class HttpConfig(TypedDict, total=False):
     timeout: None | float | httpx.Timeout
     trust_env: bool
     max_redirects: int
+    # number of extra keep-alive connections to open after connecting, not passed to HTTPX
+    pool_warmup: int
 
 
 SortMode = Literal['default', 'insensitive']
@@ -111,6 +111,8 @@ class SyncHTTPEngine(BaseHTTPEngine, SyncAbstractEngine):
         **kwargs: Any,
     ) -> None:
         super().__init__(url=url, headers=headers)
+        # handled by the service engines, it is not an HTTPX option
+        kwargs.pop('pool_warmup', None)
         self.session = SyncHTTP(**kwargs)
 
     @override
@@ -178,6 +180,8 @@ class AsyncHTTPEngine(BaseHTTPEngine, AsyncAbstractEngine):
         **kwargs: Any,
     ) -> None:
         super().__init__(url=url, headers=headers)
+        # handled by the service engines, it is not an HTTPX option
+        kwargs.pop('pool_warmup', None)
         self.session = AsyncHTTP(**kwargs)
 
     @override
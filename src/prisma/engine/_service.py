@@ -9,23 +9,32 @@ existing binary engine while enabling use with Prisma 6+/7.
 from __future__ import annotations
 
 import os
+import re
 import sys
-import json
 import time
-import shutil
+import random
+import signal
 import logging
 import subprocess
 import atexit
-from typing import TYPE_CHECKING, Any, overload
+import asyncio
+import threading
+import contextlib
+from typing import IO, TYPE_CHECKING, Any, Generic, TypeVar, Callable, Iterable, Iterator, overload
 from pathlib import Path
+from collections import deque
 from datetime import timedelta
+from functools import partial, lru_cache, update_wrapper
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
 from typing_extensions import Literal, override
 
+import httpx
+
 from . import errors
 from ._http import SyncHTTPEngine, AsyncHTTPEngine
 from ..utils import time_since
 from .._types import HttpConfig, TransactionId
-from .._builder import dumps
 from .._constants import DEFAULT_CONNECT_TIMEOUT
 
 if TYPE_CHECKING:
@@ -37,18 +46,122 @@ __all__ = (
     'AsyncServiceEngine',
 )
 
+_T = TypeVar('_T')
+
 log: logging.Logger = logging.getLogger(__name__)
 
 # Default bridge service URL
 DEFAULT_SERVICE_URL = 'http://localhost:4466'
 
+# The bridge can only be auto-started when it is expected to run on this machine
+_LOCAL_HOSTS = frozenset({'localhost', '127.0.0.1', '::1', '0.0.0.0'})
+
 # Bridge startup timeout
 BRIDGE_STARTUP_TIMEOUT = 30  # seconds
 
+# Repeated connect() calls within this window skip the health check
+CONNECTED_TTL = 5  # seconds
+
+# Number of extra connections opened after connecting, see `HttpConfig.pool_warmup`
+DEFAULT_POOL_WARMUP = 4
+
+# Keep idle connections to the bridge around so they can be reused by subsequent queries
+DEFAULT_HTTP_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=50, keepalive_expiry=10.0)
+
+# Major version in the output of `node --version`, e.g. b'v20.1.0'
+_NODE_VERSION_RE = re.compile(rb'^v(\d+)\.')
+
+# Number of lines of bridge stderr kept around to report why it failed to start
+BRIDGE_OUTPUT_LINES = 200
+
+# Health probes made while starting the bridge, nothing listening on a local port fails immediately
+_PROBE_TIMEOUT = httpx.Timeout(2.0, connect=0.2)
+
+# The bridge runs in its own process group so that it can be stopped together with
+# the node processes that npm starts, see `_terminate_processes()`
+if sys.platform == 'win32':
+    _PROCESS_GROUP_KWARGS: dict[str, Any] = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    _PROCESS_GROUP_KWARGS: dict[str, Any] = {'start_new_session': True}
+
+# Bridge processes spawned by any engine keyed by service URL, engines connecting to
+# the same URL share a single bridge which is stopped when the interpreter exits
+_BRIDGE_REGISTRY: dict[str, subprocess.Popen[bytes]] = {}
+_BRIDGE_REGISTRY_LOCK = threading.Lock()
+
+# Held while starting the bridge for a given URL so that concurrent connects do not spawn it twice
+_BRIDGE_START_LOCKS: dict[str, threading.Lock] = {}
+_shutdown_registered = False
+
+
+@lru_cache(maxsize=None)
+def _probe_client() -> httpx.Client:
+    """Client used to check whether the bridge is up, its connections are kept alive between probes."""
+    # the bridge is only ever probed on the local machine so proxies etc. are irrelevant
+    return httpx.Client(timeout=_PROBE_TIMEOUT, trust_env=False)
+
+
+def _backoff_delays(
+    *,
+    base: float = 0.02,
+    cap: float = 1.0,
+    jitter: float = 0.2,
+) -> Iterator[float]:
+    """Yield exponentially growing, jittered retry delays, callers are responsible for stopping."""
+    delay = base
+    while True:
+        yield delay * (1 + random.uniform(-jitter, jitter))
+        delay = min(cap, delay * 2)
+
+
+def _is_recoverable(exc: Exception) -> bool:
+    """Whether a failed health check is worth retrying, e.g. because the bridge is still booting."""
+    if isinstance(exc, errors.EngineRequestError):
+        # the bridge responds with a 503 until it can reach the database
+        return exc.response.status >= 500
+    return isinstance(exc, (ConnectionRefusedError, httpx.TransportError, errors.EngineConnectionError))
+
+
+class _SuccessCache(Generic[_T]):
+    """Cache the result of a function without arguments once it succeeds.
 
+    Failures are not cached so that fixing them, e.g. by installing Node.js, takes effect without
+    restarting the process.
+    """
+
+    def __init__(self, func: Callable[[], _T], is_success: Callable[[_T], bool]) -> None:
+        self._func = func
+        self._is_success = is_success
+        self._cached: tuple[_T] | None = None
+        update_wrapper(self, func)
+
+    def __call__(self) -> _T:
+        if self._cached is not None:
+            return self._cached[0]
+
+        result = self._func()
+        if self._is_success(result):
+            self._cached = (result,)
+        return result
+
+    def cache_clear(self) -> None:
+        self._cached = None
+
+
+def _cache_success(is_success: Callable[[_T], bool]) -> Callable[[Callable[[], _T]], _SuccessCache[_T]]:
+    def decorator(func: Callable[[], _T]) -> _SuccessCache[_T]:
+        return _SuccessCache(func, is_success)
+
+    return decorator
+
+
+@_cache_success(lambda path: path is not None)
 def _find_bridge_directory() -> Path | None:
     """Find the prisma-bridge directory in various locations.
 
+    Once found, the directory is cached for the lifetime of the process, call
+    `_find_bridge_directory.cache_clear()` if `PRISMA_BRIDGE_DIR` or the working directory changes.
+
     Search order:
     1. PRISMA_BRIDGE_DIR environment variable
     2. Bundled with package (src/prisma/bridge/)
@@ -89,20 +202,21 @@ def _find_bridge_directory() -> Path | None:
     return None
 
 
+@_cache_success(lambda result: result[0])
 def _check_node_available() -> tuple[bool, str]:
-    """Check if Node.js is available and return version."""
+    """Check if Node.js is available and return version, cached once found as spawning node is slow."""
     try:
         result = subprocess.run(
             ['node', '--version'],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             timeout=5,
         )
         if result.returncode == 0:
-            version = result.stdout.strip()
+            version = result.stdout[:16].decode('ascii', 'ignore').strip()
             # Check minimum version (18+)
-            version_num = version.lstrip('v').split('.')[0]
-            if int(version_num) >= 18:
+            match = _NODE_VERSION_RE.match(result.stdout)
+            if match and int(match.group(1)) >= 18:
                 return True, version
             return False, f'Node.js {version} found, but v18+ is required'
         return False, 'Node.js not working properly'
@@ -114,17 +228,18 @@ def _check_node_available() -> tuple[bool, str]:
         return False, f'Error checking Node.js: {e}'
 
 
+@_cache_success(lambda result: result[0])
 def _check_npm_available() -> tuple[bool, str]:
-    """Check if npm is available."""
+    """Check if npm is available, cached once found as spawning npm is slow."""
     try:
         result = subprocess.run(
             ['npm', '--version'],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             timeout=5,
         )
         if result.returncode == 0:
-            return True, result.stdout.strip()
+            return True, result.stdout[:16].decode('ascii', 'ignore').strip()
         return False, 'npm not working properly'
     except FileNotFoundError:
         return False, 'npm not found. Please install Node.js 18+ from https://nodejs.org'
@@ -134,9 +249,130 @@ def _check_npm_available() -> tuple[bool, str]:
         return False, f'Error checking npm: {e}'
 
 
+def _bridge_dependencies_installed(bridge_dir: Path) -> bool:
+    """Whether the bridge dependencies were installed after its lockfile last changed.
+
+    npm writes `node_modules/.package-lock.json` when installing, comparing modification
+    times avoids running `npm install` just to find out that everything is up to date.
+    """
+    node_modules = bridge_dir / 'node_modules'
+    try:
+        installed_at = os.stat(node_modules / '.package-lock.json').st_mtime
+    except FileNotFoundError:
+        # npm < 7 does not write the hidden lockfile
+        return node_modules.exists()
+
+    try:
+        return installed_at >= os.stat(bridge_dir / 'package-lock.json').st_mtime
+    except FileNotFoundError:
+        return True
+
+
+def _open_bridge_log() -> int:
+    """Return where the bridge output should go, DEVNULL unless PRISMA_BRIDGE_LOG_FILE is set.
+
+    The output must never be sent to a pipe that nobody reads from as the bridge
+    would block once the pipe buffer fills up, see `_drain_output()`.
+    """
+    path = os.environ.get('PRISMA_BRIDGE_LOG_FILE')
+    if not path:
+        return subprocess.DEVNULL
+    return os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+
+def _drain_output(stream: IO[bytes], lines: deque[str]) -> None:
+    """Read from the given stream until it is closed, so that the process writing to it never blocks."""
+    with stream:
+        for line in stream:
+            lines.append(line.decode('utf-8', 'replace').rstrip())
+
+
+def _signal_process_group(process: subprocess.Popen[bytes], sig: int) -> None:
+    # the group may be gone already
+    with contextlib.suppress(ProcessLookupError, PermissionError):
+        os.killpg(process.pid, sig)
+
+
+def _terminate_processes(processes: Iterable[subprocess.Popen[bytes]], timeout: float = 2) -> None:
+    """Stop the given bridge processes and everything they started.
+
+    npm does not forward signals to the server it starts, so the whole process group is signalled.
+    Every process is signalled before waiting for any of them so that stopping them takes as long
+    as the slowest one instead of the sum of all of them.
+    """
+    processes = list(processes)
+    for process in processes:
+        if sys.platform == 'win32':
+            process.send_signal(signal.CTRL_BREAK_EVENT)
+        else:
+            _signal_process_group(process, signal.SIGTERM)
+
+    # Popen.wait() backs off to polling every 50ms, poll more often so
+    # that we return as soon as the bridges have actually exited
+    deadline = time.monotonic() + timeout
+    running = [process for process in processes if process.poll() is None]
+    while running and time.monotonic() < deadline:
+        time.sleep(0.01)
+        running = [process for process in running if process.poll() is None]
+
+    for process in running:
+        if sys.platform == 'win32':
+            process.kill()
+        else:
+            _signal_process_group(process, signal.SIGKILL)
+        process.wait()
+
+
+def _track_bridge_process(service_url: str, process: subprocess.Popen[bytes]) -> None:
+    """Share the given bridge process with other engines and ensure it is stopped when the interpreter exits."""
+    global _shutdown_registered
+
+    with _BRIDGE_REGISTRY_LOCK:
+        if not _shutdown_registered:
+            atexit.register(_shutdown_bridges)
+            _shutdown_registered = True
+
+        _BRIDGE_REGISTRY[service_url] = process
+
+
+def _registered_bridge(service_url: str) -> subprocess.Popen[bytes] | None:
+    """Return the bridge process previously spawned for the given URL if it is still running."""
+    with _BRIDGE_REGISTRY_LOCK:
+        process = _BRIDGE_REGISTRY.get(service_url)
+        if process is not None and process.poll() is not None:
+            del _BRIDGE_REGISTRY[service_url]
+            return None
+        return process
+
+
+def _bridge_start_lock(service_url: str) -> threading.Lock:
+    with _BRIDGE_REGISTRY_LOCK:
+        return _BRIDGE_START_LOCKS.setdefault(service_url, threading.Lock())
+
+
+def _untrack_bridge_process(service_url: str, process: subprocess.Popen[bytes]) -> None:
+    with _BRIDGE_REGISTRY_LOCK:
+        if _BRIDGE_REGISTRY.get(service_url) is process:
+            del _BRIDGE_REGISTRY[service_url]
+
+
+def _shutdown_bridges() -> None:
+    """Stop every bridge we spawned.
+
+    No threads are used as some Python versions refuse to start them at interpreter shutdown.
+    Bridges that have already been reaped are skipped as their process group may now belong
+    to an unrelated process.
+    """
+    _terminate_processes(process for process in _BRIDGE_REGISTRY.values() if process.returncode is None)
+    _BRIDGE_REGISTRY.clear()
+
+
 class BaseServiceEngine:
     """Base class for service-based engine communication."""
 
+    # Use /status endpoint for compatibility with existing protocol
+    _HEALTH_PATH = '/health/status'
+
     service_url: str
     dml_path: Path
     _bridge_process: subprocess.Popen[bytes] | None
@@ -153,6 +389,10 @@ class BaseServiceEngine:
         self.dml_path = dml_path
         self.service_url = service_url or os.environ.get('PRISMA_BRIDGE_URL', DEFAULT_SERVICE_URL)
 
+        parsed = urlparse(self.service_url)
+        self._host = parsed.hostname or 'localhost'
+        self._port = parsed.port or 4466
+
         # Auto-start is enabled by default for seamless experience (like old binary engine)
         # Can be disabled with PRISMA_BRIDGE_AUTO_START=false for manual/Docker setups
         if auto_start_bridge is not None:
@@ -164,69 +404,122 @@ class BaseServiceEngine:
         self._log_queries = log_queries
         self._bridge_process = None
         self._bridge_dir = None
-
-    def _is_bridge_running(self) -> bool:
-        """Check if bridge is already running by connecting to health endpoint."""
-        import socket
-        from urllib.parse import urlparse
-
-        parsed = urlparse(self.service_url)
-        host = parsed.hostname or 'localhost'
-        port = parsed.port or 4466
-
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(1)
+        self._bridge_output: deque[str] = deque(maxlen=BRIDGE_OUTPUT_LINES)
+        self._bridge_output_thread: threading.Thread | None = None
+        self._pool_warmup = DEFAULT_POOL_WARMUP
+        self._last_connected_at: float | None = None
+
+    def _interpret_health(self, data: Any) -> Literal['ok', 'retry', 'fail']:
+        """Classify a `/health/status` response from the bridge."""
+        if data.get('status') == 'ok':
+            return 'ok'
+        if data.get('Errors'):
+            return 'retry'
+        return 'fail'
+
+    def _connected_recently(self) -> bool:
+        """Whether a health check succeeded within the last `CONNECTED_TTL` seconds."""
+        return self._last_connected_at is not None and time.monotonic() - self._last_connected_at < CONNECTED_TTL
+
+    def _connection_error(self) -> errors.EngineConnectionError:
+        return errors.EngineConnectionError(f'Could not connect to Prisma Bridge Service at {self.service_url}')
+
+    def _stub_metrics(self, format: MetricsFormat) -> str | dict[str, Any]:
+        """Empty metrics, returned when the bridge does not expose the metrics endpoints."""
+        if format == 'prometheus':
+            return ''
+        return {'counters': [], 'gauges': [], 'histograms': []}
+
+    def _prepare_http_config(self, http_config: HttpConfig | None) -> dict[str, Any]:
+        """Apply the service engine defaults and read the options that are handled by the engine itself."""
+        config: dict[str, Any] = {'limits': DEFAULT_HTTP_LIMITS, **(http_config or {})}
+        self._pool_warmup = config.get('pool_warmup', DEFAULT_POOL_WARMUP)
+        return config
+
+    def _probe_bridge(self) -> int | None:
+        """Return the status code of the bridge health endpoint or None if nothing is listening.
+
+        The async engine starts the bridge from the default executor. Its `httpx.AsyncClient` session
+        is bound to the event loop and cannot be used from that thread, so a shared synchronous
+        client is used instead.
+        """
         try:
-            sock.connect((host, port))
-            sock.close()
-            return True
-        except (ConnectionRefusedError, socket.timeout, OSError):
-            return False
-        finally:
-            sock.close()
+            return _probe_client().get(f'{self.service_url}/health').status_code
+        except httpx.TransportError:
+            return None
 
     def _wait_for_bridge_ready(self, timeout: float = BRIDGE_STARTUP_TIMEOUT) -> bool:
         """Wait for bridge to be ready by polling health endpoint."""
-        import urllib.request
-        import urllib.error
-
-        health_url = f'{self.service_url}/health'
         start = time.monotonic()
+        deadline = start + timeout
 
-        while time.monotonic() - start < timeout:
-            try:
-                req = urllib.request.Request(health_url, method='GET')
-                with urllib.request.urlopen(req, timeout=2) as response:
-                    if response.status == 200:
-                        data = json.loads(response.read().decode())
-                        if data.get('status') == 'ok':
-                            log.info('Bridge service ready in %.2fs', time.monotonic() - start)
-                            return True
-            except (urllib.error.URLError, urllib.error.HTTPError, json.JSONDecodeError, OSError):
-                pass
-
-            # Check if process died
+        for delay in _backoff_delays():
+            # Fail fast if the process died instead of waiting out the full timeout
             if self._bridge_process and self._bridge_process.poll() is not None:
                 returncode = self._bridge_process.returncode
-                stderr = ''
-                if self._bridge_process.stderr:
-                    stderr = self._bridge_process.stderr.read().decode()
-                log.error('Bridge process exited with code %d: %s', returncode, stderr)
+
+                # the processes npm started may still be running
+                self._stop_bridge()
+                hint = self._bridge_output_hint()
+                raise errors.EngineConnectionError(
+                    f'Bridge service exited with code {returncode} before becoming ready.\n\n{hint}'
+                )
+
+            if self._probe_bridge() == 200:
+                log.info('Bridge service ready in %.2fs', time.monotonic() - start)
+                return True
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 return False
 
-            time.sleep(0.5)
+            time.sleep(min(delay, remaining))
 
         return False
 
-    def _start_bridge_if_needed(self) -> None:
-        """Start the bridge service if auto_start_bridge is enabled."""
+    def _bridge_output_hint(self) -> str:
+        """Describe where to find the output of a bridge that failed to start."""
+        log_file = os.environ.get('PRISMA_BRIDGE_LOG_FILE')
+        if log_file:
+            return f'See {log_file} for the bridge output.'
+
+        if self._bridge_output_thread is not None:
+            # give the thread a chance to read whatever the bridge wrote before exiting
+            self._bridge_output_thread.join(timeout=1)
+
+        if self._bridge_output:
+            return 'Bridge output:\n' + '\n'.join(self._bridge_output)
+        return 'Set PRISMA_BRIDGE_LOG_FILE to a file path to capture the bridge output.'
+
+    def _start_bridge_if_needed(self) -> bool:
+        """Start the bridge service if auto_start_bridge is enabled.
+
+        Returns whether the bridge was just seen to be healthy.
+        """
         if not self._auto_start_bridge:
-            return
+            return False
+
+        if self._host not in _LOCAL_HOSTS:
+            log.info('Not auto-starting the bridge service as %s is not a local address', self.service_url)
+            return False
+
+        with _bridge_start_lock(self.service_url):
+            return self._start_bridge()
+
+    def _start_bridge(self) -> bool:
+        """Start the bridge unless it is already running, must be called with `_bridge_start_lock()` held."""
+        # Reuse a bridge that another engine already started for this URL
+        process = _registered_bridge(self.service_url)
+        if process is not None:
+            log.debug('Reusing bridge service started for %s', self.service_url)
+            self._bridge_process = process
+            return False
 
         # Check if bridge is already running
-        if self._is_bridge_running():
+        status = self._probe_bridge()
+        if status is not None:
             log.debug('Bridge service already running at %s', self.service_url)
-            return
+            return status == 200
 
         # Find bridge directory
         self._bridge_dir = _find_bridge_directory()
@@ -243,8 +536,13 @@ class BaseServiceEngine:
                 'See: https://github.com/RobertCraigie/prisma-client-py#quick-start'
             )
 
+        # Both checks spawn a process, so npm is checked on another thread while node is checked here
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='prisma-npm-check') as executor:
+            npm_check = executor.submit(_check_npm_available)
+            node_ok, node_msg = _check_node_available()
+            npm_ok, npm_msg = npm_check.result()
+
         # Check Node.js
-        node_ok, node_msg = _check_node_available()
         if not node_ok:
             raise errors.EngineConnectionError(
                 f'Node.js is required to run the Prisma Bridge service.\n\n'
@@ -255,16 +553,14 @@ class BaseServiceEngine:
             )
 
         # Check npm
-        npm_ok, npm_msg = _check_npm_available()
         if not npm_ok:
             raise errors.EngineConnectionError(
                 f'npm is required to run the Prisma Bridge service.\n\n'
                 f'{npm_msg}'
             )
 
-        # Check if node_modules exists, if not run npm install
-        node_modules = self._bridge_dir / 'node_modules'
-        if not node_modules.exists():
+        # Install dependencies if they are missing or the lockfile changed since they were installed
+        if not _bridge_dependencies_installed(self._bridge_dir):
             log.info('Installing bridge dependencies (npm install)...')
             try:
                 result = subprocess.run(
@@ -278,36 +574,34 @@ class BaseServiceEngine:
                     raise errors.EngineConnectionError(
                         f'Failed to install bridge dependencies:\n{result.stderr}'
                     )
+
+                # npm leaves the hidden lockfile alone when there was nothing to install
+                with contextlib.suppress(OSError):
+                    os.utime(self._bridge_dir / 'node_modules' / '.package-lock.json')
             except subprocess.TimeoutExpired:
                 raise errors.EngineConnectionError(
                     'npm install timed out. Please run manually:\n'
                     f'  cd {self._bridge_dir} && npm install'
                 )
 
-        # Parse port from service URL
-        from urllib.parse import urlparse
-        parsed = urlparse(self.service_url)
-        port = parsed.port or 4466
-
         # Start the bridge service
         log.info('Starting bridge service at %s...', self.service_url)
 
         env = os.environ.copy()
-        env['PORT'] = str(port)
-        env['PRISMA_BRIDGE_PORT'] = str(port)
+        env['PORT'] = str(self._port)
+        env['PRISMA_BRIDGE_PORT'] = str(self._port)
         
-        # Pass the schema path so the bridge can use the project's schema
-        # Look for schema.prisma in common locations relative to the dml_path
-        schema_candidates = [
-            self.dml_path,  # Directly provided path
-            self.dml_path.parent / 'schema.prisma' if self.dml_path.is_file() else None,
-            Path.cwd() / 'schema.prisma',
-            Path.cwd() / 'prisma' / 'schema.prisma',
-        ]
-        
-        for candidate in schema_candidates:
-            if candidate and candidate.exists():
-                env['PRISMA_SCHEMA_PATH'] = str(candidate)
+        # Pass the schema path so the bridge can use the project's schema, falling back
+        # to the default locations in the working directory. The bridge runs from its own
+        # directory so the path must be absolute.
+        cwd = os.getcwd()
+        for candidate in (
+            os.path.join(cwd, self.dml_path),
+            os.path.join(cwd, 'schema.prisma'),
+            os.path.join(cwd, 'prisma', 'schema.prisma'),
+        ):
+            if os.path.isfile(candidate):
+                env['PRISMA_SCHEMA_PATH'] = candidate
                 log.debug('Found project schema at %s', candidate)
                 break
 
@@ -315,15 +609,33 @@ class BaseServiceEngine:
         # npm start runs the pre-compiled JavaScript, avoiding ts-node dependency issues
         cmd = ['npm', 'start']
 
-        self._bridge_process = subprocess.Popen(
-            cmd,
-            cwd=str(self._bridge_dir),
-            env=env,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+        # Without a log file stderr is still read so that we can report why the bridge failed
+        output = _open_bridge_log()
+        capture = output == subprocess.DEVNULL
+        try:
+            self._bridge_process = subprocess.Popen(
+                cmd,
+                cwd=str(self._bridge_dir),
+                env=env,
+                stdout=output,
+                stderr=subprocess.PIPE if capture else output,
+                **_PROCESS_GROUP_KWARGS,
+            )
+        finally:
+            if not capture:
+                os.close(output)
+
+        if capture:
+            self._bridge_output.clear()
+            self._bridge_output_thread = threading.Thread(
+                target=_drain_output,
+                args=(self._bridge_process.stderr, self._bridge_output),
+                name='prisma-bridge-output',
+                daemon=True,
+            )
+            self._bridge_output_thread.start()
 
-        atexit.register(self._stop_bridge)
+        _track_bridge_process(self.service_url, self._bridge_process)
 
         # Wait for bridge to be ready with proper health check
         if not self._wait_for_bridge_ready():
@@ -335,20 +647,27 @@ class BaseServiceEngine:
                 'Common issues:\n'
                 '- DATABASE_URL not set\n'
                 '- Port 4466 already in use\n'
-                '- Missing prisma generate'
+                '- Missing prisma generate\n\n'
+                f'{self._bridge_output_hint()}'
             )
 
+        return True
+
     def _stop_bridge(self) -> None:
         """Stop the bridge service if we started it."""
         if self._bridge_process is not None:
             log.debug('Stopping bridge service...')
-            self._bridge_process.terminate()
-            try:
-                self._bridge_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self._bridge_process.kill()
+            _terminate_processes([self._bridge_process])
+            _untrack_bridge_process(self.service_url, self._bridge_process)
             self._bridge_process = None
 
+    def _release_bridge(self) -> None:
+        """Stop using the bridge service.
+
+        The bridge is left running as other engines may be sharing it, it is stopped when the interpreter exits.
+        """
+        self._bridge_process = None
+
 
 class SyncServiceEngine(BaseServiceEngine, SyncHTTPEngine):
     """Synchronous engine that communicates with Prisma Bridge Service."""
@@ -369,23 +688,34 @@ class SyncServiceEngine(BaseServiceEngine, SyncHTTPEngine):
             auto_start_bridge=auto_start_bridge,
             log_queries=log_queries,
         )
-        SyncHTTPEngine.__init__(self, url=self.service_url, **(http_config or {}))
+        SyncHTTPEngine.__init__(self, url=self.service_url, **self._prepare_http_config(http_config))
 
-        atexit.register(self.stop)
+    @override
+    def _probe_bridge(self) -> int | None:
+        # go through our own session so that the first query can reuse the connection
+        if self.session.closed:
+            return super()._probe_bridge()
+
+        try:
+            return self.session.request('GET', f'{self.service_url}/health', timeout=_PROBE_TIMEOUT).status
+        except httpx.TransportError:
+            return None
 
     @override
     def close(self, *, timeout: timedelta | None = None) -> None:
         log.debug('Closing service engine connection...')
+        self._last_connected_at = None
         self._close_session()
         log.debug('Closed service engine connection')
 
     @override
     async def aclose(self, *, timeout: timedelta | None = None) -> None:
-        self.close(timeout=timeout)
+        # closing the session blocks, so keep it off the event loop
+        await asyncio.get_running_loop().run_in_executor(None, partial(self.close, timeout=timeout))
 
     def stop(self, *, timeout: timedelta | None = None) -> None:
         """Stop the engine and cleanup resources."""
-        self._stop_bridge()
+        self._release_bridge()
 
     @override
     def connect(
@@ -397,34 +727,47 @@ class SyncServiceEngine(BaseServiceEngine, SyncHTTPEngine):
         if datasources:
             log.debug('Datasources: %s', datasources)
 
-        self._start_bridge_if_needed()
+        if self._connected_recently() and not self.session.closed:
+            log.debug('Connected to Prisma Bridge Service recently, skipping health check')
+            return
+
+        # the bridge was just seen to be healthy, so if it fails now it is not worth retrying
+        healthy = self._start_bridge_if_needed()
 
         start = time.monotonic()
         last_exc = None
+        debug = log.isEnabledFor(logging.DEBUG)
 
-        # Health check loop
-        for _ in range(int(timeout.total_seconds() / 0.1)):
+        # bound by wall-clock time as each attempt can itself take a while
+        deadline = start + timeout.total_seconds()
+        for delay in _backoff_delays():
             try:
-                # Use /status endpoint for compatibility with existing protocol
-                data = self.request('GET', '/health/status')
-                if data.get('status') == 'ok':
+                state = self._interpret_health(self.request('GET', self._HEALTH_PATH))
+            except Exception as exc:
+                last_exc = exc
+                if healthy or not _is_recoverable(exc):
+                    break
+
+                if debug:
+                    log.debug('Could not connect to bridge: %s; retrying...', exc)
+            else:
+                if state == 'ok':
+                    self._last_connected_at = time.monotonic()
                     log.debug('Connected to Prisma Bridge Service in %s', time_since(start))
                     return
-                if data.get('Errors'):
+                if healthy or state == 'fail':
+                    break
+
+                if debug:
                     log.debug('Bridge returned errors, retrying...')
-                    time.sleep(0.1)
-                    continue
-            except Exception as exc:
-                last_exc = exc
-                log.debug('Could not connect to bridge: %s; retrying...', exc)
-                time.sleep(0.1)
-                continue
 
-            break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
 
-        raise errors.EngineConnectionError(
-            f'Could not connect to Prisma Bridge Service at {self.service_url}'
-        ) from last_exc
+            time.sleep(min(delay, remaining))
+
+        raise self._connection_error() from last_exc
 
     @override
     def query(
@@ -433,9 +776,7 @@ class SyncServiceEngine(BaseServiceEngine, SyncHTTPEngine):
         *,
         tx_id: TransactionId | None,
     ) -> Any:
-        headers: dict[str, str] = {}
-        if tx_id is not None:
-            headers['X-transaction-id'] = tx_id
+        headers = None if tx_id is None else {'X-transaction-id': tx_id}
 
         if self._log_queries:
             log.info('Query: %s', content)
@@ -490,17 +831,12 @@ class SyncServiceEngine(BaseServiceEngine, SyncHTTPEngine):
         """Fetch metrics from the bridge service."""
         try:
             if format == 'prometheus':
-                # Fetch from /metrics endpoint
                 data = self.request('GET', '/metrics')
                 return data if isinstance(data, str) else ''
-            else:
-                # Return structured metrics
-                return self.request('GET', '/metrics/json')
+            return self.request('GET', '/metrics/json')
         except Exception:
             # Fallback to empty metrics if endpoint not available
-            if format == 'prometheus':
-                return ''
-            return {'counters': [], 'gauges': [], 'histograms': []}
+            return self._stub_metrics(format)
 
 
 class AsyncServiceEngine(BaseServiceEngine, AsyncHTTPEngine):
@@ -522,9 +858,7 @@ class AsyncServiceEngine(BaseServiceEngine, AsyncHTTPEngine):
             auto_start_bridge=auto_start_bridge,
             log_queries=log_queries,
         )
-        AsyncHTTPEngine.__init__(self, url=self.service_url, **(http_config or {}))
-
-        atexit.register(self.stop)
+        AsyncHTTPEngine.__init__(self, url=self.service_url, **self._prepare_http_config(http_config))
 
     @override
     def close(self, *, timeout: timedelta | None = None) -> None:
@@ -533,12 +867,13 @@ class AsyncServiceEngine(BaseServiceEngine, AsyncHTTPEngine):
     @override
     async def aclose(self, *, timeout: timedelta | None = None) -> None:
         log.debug('Async closing service engine connection...')
+        self._last_connected_at = None
         await self._close_session()
         log.debug('Closed service engine connection')
 
     def stop(self, *, timeout: timedelta | None = None) -> None:
         """Stop the engine and cleanup resources."""
-        self._stop_bridge()
+        self._release_bridge()
 
     @override
     async def connect(
@@ -550,35 +885,61 @@ class AsyncServiceEngine(BaseServiceEngine, AsyncHTTPEngine):
         if datasources:
             log.debug('Datasources: %s', datasources)
 
-        self._start_bridge_if_needed()
+        if self._connected_recently() and not self.session.closed:
+            log.debug('Connected to Prisma Bridge Service recently, skipping health check')
+            return
+
+        # the bridge was just seen to be healthy, so if it fails now it is not worth retrying
+        # starting the bridge blocks, so keep it off the event loop
+        healthy = await asyncio.get_running_loop().run_in_executor(None, self._start_bridge_if_needed)
 
-        import asyncio
         start = time.monotonic()
         last_exc = None
+        debug = log.isEnabledFor(logging.DEBUG)
 
-        # Health check loop
-        for _ in range(int(timeout.total_seconds() / 0.1)):
+        # bound by wall-clock time as each attempt can itself take a while
+        deadline = start + timeout.total_seconds()
+        for delay in _backoff_delays():
             try:
-                # Use /status endpoint for compatibility with existing protocol
-                data = await self.request('GET', '/health/status')
-                if data.get('status') == 'ok':
+                state = self._interpret_health(await self.request('GET', self._HEALTH_PATH))
+            except Exception as exc:
+                last_exc = exc
+                if healthy or not _is_recoverable(exc):
+                    break
+
+                if debug:
+                    log.debug('Could not connect to bridge: %s; retrying...', exc)
+            else:
+                if state == 'ok':
+                    self._last_connected_at = time.monotonic()
+                    await self._warm_pool()
                     log.debug('Connected to Prisma Bridge Service in %s', time_since(start))
                     return
-                if data.get('Errors'):
+                if healthy or state == 'fail':
+                    break
+
+                if debug:
                     log.debug('Bridge returned errors, retrying...')
-                    await asyncio.sleep(0.1)
-                    continue
-            except Exception as exc:
-                last_exc = exc
-                log.debug('Could not connect to bridge: %s; retrying...', exc)
-                await asyncio.sleep(0.1)
-                continue
 
-            break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            await asyncio.sleep(min(delay, remaining))
 
-        raise errors.EngineConnectionError(
-            f'Could not connect to Prisma Bridge Service at {self.service_url}'
-        ) from last_exc
+        raise self._connection_error() from last_exc
+
+    async def _warm_pool(self) -> None:
+        """Open additional keep-alive connections so the first concurrent queries can reuse them."""
+        if self._pool_warmup <= 0:
+            return
+
+        # concurrent requests force the pool to open a connection for each of them,
+        # failures are not fatal as the connection will just be opened on demand instead
+        await asyncio.gather(
+            *(self.request('GET', self._HEALTH_PATH) for _ in range(self._pool_warmup)),
+            return_exceptions=True,
+        )
 
     @override
     async def query(
@@ -587,9 +948,7 @@ class AsyncServiceEngine(BaseServiceEngine, AsyncHTTPEngine):
         *,
         tx_id: TransactionId | None,
     ) -> Any:
-        headers: dict[str, str] = {}
-        if tx_id is not None:
-            headers['X-transaction-id'] = tx_id
+        headers = None if tx_id is None else {'X-transaction-id': tx_id}
 
         if self._log_queries:
             log.info('Query: %s', content)
@@ -646,9 +1005,7 @@ class AsyncServiceEngine(BaseServiceEngine, AsyncHTTPEngine):
             if format == 'prometheus':
                 data = await self.request('GET', '/metrics')
                 return data if isinstance(data, str) else ''
-            else:
-                return await self.request('GET', '/metrics/json')
+            return await self.request('GET', '/metrics/json')
         except Exception:
-            if format == 'prometheus':
-                return ''
-            return {'counters': [], 'gauges': [], 'histograms': []}
+            # Fallback to empty metrics if endpoint not available
+            return self._stub_metrics(format)
@@ -3,15 +3,28 @@
 As of v0.13.0, Prisma Client Python uses a TypeScript bridge service
 instead of Rust binaries. These tests verify the ServiceEngine functionality.
 """
+
+import os
+import sys
+import json
+import time
+import shutil
+import signal
+import socket
 import asyncio
 import contextlib
-from typing import Iterator, Optional
+import subprocess
+from typing import Any, List, Tuple, Iterator, NoReturn, Optional, cast
+from pathlib import Path
+from datetime import timedelta
 
+import httpx
 import pytest
 
 from prisma import Prisma
-from prisma.engine import errors
+from prisma.engine import SyncServiceEngine, AsyncServiceEngine, errors, _service
 from prisma._compat import get_running_loop
+from prisma._sync_http import Response
 
 from .utils import skipif_windows
 
@@ -78,6 +91,344 @@ async def test_query_after_disconnect_raises() -> None:
         await db.user.find_many()
 
 
+def test_auto_start_skipped_for_remote_bridge() -> None:
+    """The bridge is not auto-started when the service URL points at another host"""
+    engine = SyncServiceEngine(
+        dml_path=Path('schema.prisma'),
+        service_url='http://bridge.example.com:4466',
+        auto_start_bridge=True,
+    )
+    engine._start_bridge_if_needed()
+    assert engine._bridge_process is None
+    assert engine._bridge_dir is None
+
+
+def test_auto_start_reuses_registered_bridge() -> None:
+    """An engine does not spawn a new bridge when one was already started for the same URL"""
+    service_url = 'http://localhost:4499'
+    process = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])
+    _service._track_bridge_process(service_url, process)
+
+    try:
+        engine = SyncServiceEngine(dml_path=Path('schema.prisma'), service_url=service_url, auto_start_bridge=True)
+        engine._start_bridge_if_needed()
+        assert engine._bridge_process is process
+
+        # stopping the engine must not stop the bridge that other engines may be using
+        engine.stop()
+        assert engine._bridge_process is None
+        assert process.poll() is None
+    finally:
+        process.kill()
+        process.wait()
+        _service._untrack_bridge_process(service_url, process)
+
+
+def test_node_check_failure_not_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Installing Node.js after a failed check takes effect without restarting the process"""
+
+    def node_not_found(*args: Any, **kwargs: Any) -> NoReturn:
+        raise FileNotFoundError()
+
+    def node_found(*args: Any, **kwargs: Any) -> 'subprocess.CompletedProcess[bytes]':
+        return subprocess.CompletedProcess(args, 0, stdout=b'v20.1.0\n')
+
+    _service._check_node_available.cache_clear()
+    try:
+        monkeypatch.setattr(subprocess, 'run', node_not_found)
+        ok, message = _service._check_node_available()
+        assert not ok
+        assert 'not found' in message
+
+        monkeypatch.setattr(subprocess, 'run', node_found)
+        assert _service._check_node_available() == (True, 'v20.1.0')
+
+        # successful checks are cached
+        monkeypatch.setattr(subprocess, 'run', node_not_found)
+        assert _service._check_node_available() == (True, 'v20.1.0')
+    finally:
+        _service._check_node_available.cache_clear()
+
+
+def test_bridge_dependencies_installed(tmp_path: Path) -> None:
+    """Bridge dependencies are reinstalled when the lockfile is newer than the last install"""
+    assert not _service._bridge_dependencies_installed(tmp_path)
+
+    # installed by npm < 7, which does not write the hidden lockfile
+    node_modules = tmp_path / 'node_modules'
+    node_modules.mkdir()
+    assert _service._bridge_dependencies_installed(tmp_path)
+
+    hidden_lockfile = node_modules / '.package-lock.json'
+    hidden_lockfile.write_text('{}')
+    assert _service._bridge_dependencies_installed(tmp_path)
+
+    lockfile = tmp_path / 'package-lock.json'
+    lockfile.write_text('{}')
+    os.utime(lockfile, (1000, 1000))
+    os.utime(hidden_lockfile, (2000, 2000))
+    assert _service._bridge_dependencies_installed(tmp_path)
+
+    os.utime(lockfile, (3000, 3000))
+    assert not _service._bridge_dependencies_installed(tmp_path)
+
+
+def _unused_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('localhost', 0))
+        return cast(int, sock.getsockname()[1])
+
+
+def _spawn_process_tree(*, ignore_sigterm: bool = False) -> Tuple['subprocess.Popen[bytes]', int]:
+    """Spawn a process in its own group, like the bridge, that starts a child of its own.
+
+    Returns the process and the pid of its child.
+    """
+    code = (
+        'import sys, time, signal, subprocess\n'
+        f'if {ignore_sigterm}: signal.signal(signal.SIGTERM, signal.SIG_IGN)\n'
+        'child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])\n'
+        'print(child.pid, flush=True)\n'
+        'time.sleep(60)\n'
+    )
+    process = subprocess.Popen(
+        [sys.executable, '-c', code],
+        stdout=subprocess.PIPE,
+        **_service._PROCESS_GROUP_KWARGS,
+    )
+    assert process.stdout is not None
+    with process.stdout:
+        child_pid = int(process.stdout.readline())
+    return process, child_pid
+
+
+def _process_exited(pid: int, timeout: float = 5) -> bool:
+    """Wait for a process that is not our child to exit, zombies count as exited"""
+    stat = Path(f'/proc/{pid}/stat')
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+
+        with contextlib.suppress(OSError):
+            if stat.read_text().rsplit(')', 1)[1].split()[0] == 'Z':
+                return True
+
+        time.sleep(0.01)
+    return False
+
+
+@skipif_windows
+def test_terminate_processes_stops_process_group() -> None:
+    """Stopping a bridge also stops the processes that it started"""
+    process, child_pid = _spawn_process_tree()
+
+    _service._terminate_processes([process], timeout=5)
+
+    assert process.returncode == -signal.SIGTERM
+    assert _process_exited(child_pid)
+
+
+@skipif_windows
+def test_terminate_processes_kills_after_timeout() -> None:
+    """Processes that ignore SIGTERM are killed once the timeout has elapsed"""
+    process, child_pid = _spawn_process_tree(ignore_sigterm=True)
+
+    start = time.monotonic()
+    _service._terminate_processes([process], timeout=0.5)
+
+    assert time.monotonic() - start >= 0.5
+    assert process.returncode == -signal.SIGKILL
+    assert _process_exited(child_pid)
+
+
+@pytest.mark.skipif(shutil.which('npm') is None or shutil.which('node') is None, reason='requires Node.js and npm')
+def test_bridge_output_reported_on_early_exit(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The stderr of a bridge that exits while starting is included in the error"""
+    script = "console.error('Error: DATABASE_URL is not set'); process.exit(3)"
+    package = {'name': 'failing-bridge', 'scripts': {'start': f'node -e "{script}"'}}
+    (tmp_path / 'package.json').write_text(json.dumps(package))
+    (tmp_path / 'node_modules').mkdir()
+
+    monkeypatch.setenv('PRISMA_BRIDGE_DIR', str(tmp_path))
+    monkeypatch.delenv('PRISMA_BRIDGE_LOG_FILE', raising=False)
+    _service._find_bridge_directory.cache_clear()
+
+    engine = SyncServiceEngine(
+        dml_path=Path('schema.prisma'),
+        service_url=f'http://localhost:{_unused_port()}',
+        auto_start_bridge=True,
+    )
+    try:
+        with pytest.raises(errors.EngineConnectionError) as exc:
+            engine.connect(timeout=timedelta(seconds=30))
+    finally:
+        _service._find_bridge_directory.cache_clear()
+
+    message = str(exc.value)
+    assert 'exited with code 3' in message
+    assert 'Error: DATABASE_URL is not set' in message
+    assert engine.service_url not in _service._BRIDGE_REGISTRY
+
+
+def _create_engine() -> SyncServiceEngine:
+    return SyncServiceEngine(
+        dml_path=Path('schema.prisma'),
+        service_url=f'http://localhost:{_unused_port()}',
+        auto_start_bridge=False,
+    )
+
+
+def test_connect_does_not_retry_client_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Errors that are not caused by the bridge still starting are raised straight away"""
+    engine = _create_engine()
+    calls = 0
+
+    def request(*args: Any, **kwargs: Any) -> NoReturn:
+        nonlocal calls
+        calls += 1
+        raise errors.EngineRequestError(Response(httpx.Response(404)), 'Not Found')
+
+    monkeypatch.setattr(engine, 'request', request)
+    with pytest.raises(errors.EngineConnectionError):
+        engine.connect(timeout=timedelta(seconds=10))
+
+    assert calls == 1
+
+
+def test_connect_skips_recent_health_check(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Connecting again shortly after a successful health check does not repeat it"""
+    engine = _create_engine()
+    calls = 0
+
+    def request(*args: Any, **kwargs: Any) -> Any:
+        nonlocal calls
+        calls += 1
+        return {'status': 'ok'}
+
+    monkeypatch.setattr(engine, 'request', request)
+    engine.connect()
+    engine.connect()
+    assert calls == 1
+
+    # closing the engine forgets the previous health check
+    engine.close()
+    assert engine._last_connected_at is None
+
+    engine.connect()
+    assert calls == 2
+
+
+def test_connect_bounded_by_timeout() -> None:
+    """Connecting gives up once the timeout has elapsed when nothing is listening"""
+    engine = _create_engine()
+
+    start = time.monotonic()
+    with pytest.raises(errors.EngineConnectionError):
+        engine.connect(timeout=timedelta(seconds=1))
+
+    assert 0.9 < time.monotonic() - start < 2
+
+
+@pytest.mark.asyncio
+async def test_async_connect_bounded_by_timeout() -> None:
+    """Connecting gives up once the timeout has elapsed when nothing is listening"""
+    engine = AsyncServiceEngine(
+        dml_path=Path('schema.prisma'),
+        service_url=f'http://localhost:{_unused_port()}',
+        auto_start_bridge=False,
+    )
+
+    start = time.monotonic()
+    with pytest.raises(errors.EngineConnectionError):
+        await engine.connect(timeout=timedelta(seconds=1))
+
+    assert 0.9 < time.monotonic() - start < 2
+    await engine.aclose()
+
+
+def test_node_check_requires_node_18(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Node.js versions older than 18 are rejected"""
+
+    def old_node(*args: Any, **kwargs: Any) -> 'subprocess.CompletedProcess[bytes]':
+        return subprocess.CompletedProcess(args, 0, stdout=b'v16.20.2\n')
+
+    _service._check_node_available.cache_clear()
+    monkeypatch.setattr(subprocess, 'run', old_node)
+    assert _service._check_node_available() == (False, 'Node.js v16.20.2 found, but v18+ is required')
+
+
+def test_connect_single_attempt_after_healthy_start(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The health check is not retried when starting the bridge just saw it healthy"""
+    engine = _create_engine()
+    calls = 0
+
+    def request(*args: Any, **kwargs: Any) -> NoReturn:
+        nonlocal calls
+        calls += 1
+        raise httpx.ConnectError('Connection refused')
+
+    monkeypatch.setattr(engine, '_start_bridge_if_needed', lambda: True)
+    monkeypatch.setattr(engine, 'request', request)
+    with pytest.raises(errors.EngineConnectionError):
+        engine.connect(timeout=timedelta(seconds=10))
+
+    assert calls == 1
+
+
+def test_pool_warmup_not_forwarded_to_httpx() -> None:
+    """The pool_warmup option is consumed by the engine instead of being passed to HTTPX"""
+    engine = SyncServiceEngine(
+        dml_path=Path('schema.prisma'),
+        service_url=f'http://localhost:{_unused_port()}',
+        auto_start_bridge=False,
+        http_config={'pool_warmup': 3},
+    )
+    assert engine._pool_warmup == 3
+
+    engine.session.open()
+    engine.close()
+
+
+@pytest.mark.asyncio
+async def test_async_pool_warmup_not_forwarded_to_httpx() -> None:
+    """The pool_warmup option is consumed by the engine instead of being passed to HTTPX"""
+    engine = AsyncServiceEngine(
+        dml_path=Path('schema.prisma'),
+        service_url=f'http://localhost:{_unused_port()}',
+        auto_start_bridge=False,
+        http_config={'pool_warmup': 3},
+    )
+    assert engine._pool_warmup == 3
+
+    engine.session.open()
+    await engine.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('pool_warmup', [0, 3])
+async def test_async_warm_pool(monkeypatch: pytest.MonkeyPatch, pool_warmup: int) -> None:
+    """One request is sent for each connection that should be opened ahead of time"""
+    engine = AsyncServiceEngine(
+        dml_path=Path('schema.prisma'),
+        service_url=f'http://localhost:{_unused_port()}',
+        auto_start_bridge=False,
+        http_config={'pool_warmup': pool_warmup},
+    )
+    paths: List[str] = []
+
+    async def request(method: str, path: str, **kwargs: Any) -> Any:
+        paths.append(path)
+        return {'status': 'ok'}
+
+    monkeypatch.setattr(engine, 'request', request)
+    await engine._warm_pool()
+
+    assert paths == [engine._HEALTH_PATH] * pool_warmup
+
+
 # Note: The following tests related to binary engines have been removed in v0.13.0:
 # - test_engine_binary_does_not_exist
 # - test_engine_binary_does_not_exist_no_binary_paths